@@ -6,19 +6,28 @@ and archives them (moves to trash). It supports dry-run mode for safe testing
 and implements rate limiting to respect Notion's API limits.
 """
 
+from __future__ import annotations
+
 import argparse
-import json
+import asyncio
+import collections
+import functools
 import logging
 import os
+import pathlib
+import random
 import re
 import sys
 import time
-from typing import Dict, List, Optional
+import uuid
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 
 try:
     import httpx
-except ImportError:
-    print("Error: httpx package not installed.")
+    import orjson
+except ImportError as e:
+    print(f"Error: {e.name} package not installed.")
     print("Install with: pip install -r requirements.txt")
     sys.exit(1)
 
@@ -31,7 +40,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# httpx logs every request at INFO; keep only its warnings and errors
+logging.getLogger('httpx').setLevel(logging.WARNING)
+
+# Matches ${VAR_NAME} placeholders in the configuration file
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+# Results requested per database query page (the maximum Notion allows)
+QUERY_PAGE_SIZE = 100
+
+# Request body for archiving a page, encoded once and reused for every delete
+ARCHIVE_BODY = orjson.dumps({"archived": True})
+
+# Number of pages archived together as one concurrent burst
+DELETE_BATCH_SIZE = 50
+
+# Maximum number of page deletions in flight at once, across all batches
+DELETE_MAX_IN_FLIGHT = 2 * DELETE_BATCH_SIZE
+
+# Maximum number of queried page IDs buffered ahead of the delete workers
+DELETE_QUEUE_SIZE = 200
+
+# Log deletion progress once per this many processed records
+PROGRESS_INTERVAL = 100
+
+# Upper bound in seconds on a computed rate-limit backoff, jitter included;
+# a longer server Retry-After fails the request instead of being shortened
+MAX_RETRY_WAIT = 30.0
+
+
+class TokenBucket:
+    """Token-bucket rate limiter shared by every request in a run.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``,
+    so short bursts are allowed while the long-run request rate stays
+    within Notion's limit (~3 requests/second). The rate adapts AIMD-style:
+    it is halved once per congestion event (a burst of 429s) and recovers
+    additively on each success, never exceeding the initial rate.
+    """
+
+    def __init__(self, rate: float = 3.0, capacity: int = 3, min_rate: float = 0.5,
+                 recovery_step: float = 0.05):
+        self.rate = rate
+        self.max_rate = rate
+        self.min_rate = min_rate
+        self.recovery_step = recovery_step
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.hold_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available, then consume it."""
+        async with self._lock:
+            self._refill()
+            if self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+    def on_rate_limited(self, retry_after: float = 1.0) -> None:
+        """Multiplicatively decrease the rate after a 429 response.
+
+        Concurrent requests caught by the same congestion event all get a
+        429, so further decreases are ignored for ``retry_after`` seconds.
+        """
+        now = time.monotonic()
+        if now < self.hold_until:
+            return
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * 0.5)
+        self.hold_until = now + retry_after
+
+    def trip(self, hold: float) -> None:
+        """Halve the rate unconditionally when the circuit breaker opens.
+
+        Unlike on_rate_limited, this is not skipped inside an earlier 429's
+        hold window, and it extends that window to at least ``hold`` seconds.
+        """
+        self._refill()
+        self.rate = max(self.min_rate, self.rate * 0.5)
+        self.hold_until = max(self.hold_until, time.monotonic() + hold)
+
+    def on_success(self) -> None:
+        """Additively increase the rate back towards its initial value."""
+        if self.rate < self.max_rate:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.recovery_step)
+
+
+class CircuitBreaker:
+    """Pause all requests while Notion is persistently rate limiting or failing.
+
+    Tracks whether each of the last ``window`` query or delete attempts hit
+    a 429 or 5xx response. When more than ``threshold`` of them did, the
+    circuit opens: requests wait ``cooldown`` seconds and the shared rate
+    limiter is slowed. The limiter's rate is then held until ``window``
+    consecutive requests succeed.
+    """
 
+    def __init__(self, bucket: TokenBucket, window: int = 50, threshold: int = 20,
+                 cooldown: float = 30.0):
+        self.bucket = bucket
+        self.window = window
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.outcomes = collections.deque(maxlen=window)
+        self.open_until = 0.0
+        self.recovering = False
+        self.consecutive_successes = 0
+
+    async def wait(self) -> None:
+        """Wait until the circuit is closed."""
+        while (delay := self.open_until - time.monotonic()) > 0:
+            await asyncio.sleep(delay)
+
+    async def acquire(self) -> None:
+        """Wait for a rate-limiter token while the circuit is closed.
+
+        The circuit can open while a request is queued for a token, so it is
+        re-checked once the token is granted; if it opened in the meantime,
+        the token is dropped and the request waits out the cooldown.
+        """
+        while True:
+            await self.wait()
+            await self.bucket.acquire()
+            if time.monotonic() >= self.open_until:
+                return
+
+    def record_success(self) -> None:
+        """Record a successful request and let the rate recover if allowed."""
+        self.outcomes.append(False)
+        self.consecutive_successes += 1
+        if self.recovering and self.consecutive_successes >= self.window:
+            self.recovering = False
+        if not self.recovering:
+            self.bucket.on_success()
+
+    def record_failure(self) -> None:
+        """Record a 429 or 5xx response, opening the circuit if needed."""
+        self.outcomes.append(True)
+        self.consecutive_successes = 0
+        if sum(self.outcomes) > self.threshold:
+            logger.warning(f"Notion is rejecting too many requests, pausing requests for {self.cooldown:.0f}s")
+            self.open_until = time.monotonic() + self.cooldown
+            self.outcomes.clear()
+            self.recovering = True
+            self.bucket.trip(self.cooldown)
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_key() -> str:
     """Get Notion API key from NOTION_API_KEY environment variable.
 
@@ -66,6 +230,22 @@ def get_api_key() -> str:
     return api_key
 
 
+def _build_headers(api_key: str) -> dict[str, str]:
+    """Build the headers sent with every Notion API request.
+
+    Args:
+        api_key: Notion API key
+
+    Returns:
+        dict: Authorization, content type and API version headers
+    """
+    return {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json',
+        'Notion-Version': '2022-06-28'
+    }
+
+
 def substitute_env_vars(text: str) -> str:
     """Substitute environment variables in text.
 
@@ -89,7 +269,7 @@ def substitute_env_vars(text: str) -> str:
             sys.exit(1)
         return value
 
-    return re.sub(r'\$\{([^}]+)\}', replace_var, text)
+    return _ENV_VAR_RE.sub(replace_var, text)
 
 
 def format_notion_id(notion_id: str) -> str:
@@ -104,19 +284,17 @@ def format_notion_id(notion_id: str) -> str:
     Returns:
         str: Formatted UUID with dashes
     """
-    # Remove any existing dashes and spaces
-    clean_id = notion_id.replace('-', '').replace(' ', '')
-
-    # Validate it's 32 hex characters
-    if len(clean_id) != 32:
-        logger.warning(f"Invalid Notion ID length: {notion_id} (expected 32 chars, got {len(clean_id)})")
+    # uuid.UUID accepts both dashed and undashed forms and validates that
+    # the ID is 32 hex characters (spaces removed first, e.g. from pasted
+    # secrets); str() formats it as 8-4-4-4-12
+    try:
+        return str(uuid.UUID(notion_id.replace(' ', '')))
+    except ValueError:
+        logger.warning(f"Invalid Notion ID: {notion_id} (expected 32 hex characters)")
         return notion_id  # Return as-is if invalid
 
-    # Format as UUID: 8-4-4-4-12
-    return f"{clean_id[:8]}-{clean_id[8:12]}-{clean_id[12:16]}-{clean_id[16:20]}-{clean_id[20:]}"
-
 
-def load_deletion_rules(config_path: str) -> Dict:
+def load_deletion_rules(config_path: str) -> dict:
     """Load deletion criteria from JSON configuration file.
 
     Args:
@@ -128,21 +306,22 @@ def load_deletion_rules(config_path: str) -> Dict:
     Raises:
         SystemExit: If config file doesn't exist or is invalid JSON
     """
-    if not os.path.exists(config_path):
+    try:
+        config_data = pathlib.Path(config_path).read_bytes()
+    except FileNotFoundError:
         logger.error(f"Configuration file not found: {config_path}")
         sys.exit(1)
 
     try:
-        with open(config_path, 'r') as f:
-            config_text = f.read()
-
-        # Substitute environment variables in the config text
-        config_text = substitute_env_vars(config_text)
+        # Substitute environment variables in the config text; files without
+        # ${VAR} placeholders are parsed straight from the raw bytes
+        if b'${' in config_data:
+            config_data = substitute_env_vars(config_data.decode())
 
         # Parse the JSON after substitution
-        config = json.loads(config_text)
+        config = orjson.loads(config_data)
 
-    except json.JSONDecodeError as e:
+    except (orjson.JSONDecodeError, UnicodeDecodeError) as e:
         logger.error(f"Invalid JSON in configuration file: {e}")
         sys.exit(1)
 
@@ -166,74 +345,148 @@ def load_deletion_rules(config_path: str) -> Dict:
     return config
 
 
-def query_database(api_key: str, database_id: str, filters: Dict) -> List[str]:
+@dataclass
+class CleanupStats:
+    """Record counts for a cleanup run (or a single database within one)."""
+
+    queried: int = 0
+    matched: int = 0
+    deleted: int = 0
+    failed: int = 0
+    query_failed: int = 0
+
+    def __add__(self, other: CleanupStats) -> CleanupStats:
+        return CleanupStats(
+            queried=self.queried + other.queried,
+            matched=self.matched + other.matched,
+            deleted=self.deleted + other.deleted,
+            failed=self.failed + other.failed,
+            query_failed=self.query_failed + other.query_failed
+        )
+
+
+def _retry_wait(response: httpx.Response, attempt: int) -> float | None:
+    """Seconds to wait before retrying a rate-limited (429) request.
+
+    The server's Retry-After is honored as a minimum, plus up to 25% jitter
+    so concurrent retries don't collide; if it asks for longer than
+    MAX_RETRY_WAIT the request is not retried. Without a usable Retry-After,
+    exponential backoff plus jitter is used, capped at MAX_RETRY_WAIT.
+
+    Args:
+        response: The 429 response
+        attempt: Zero-based number of the attempt that was rate limited
+
+    Returns:
+        float: Seconds to wait, or None if the request should not be retried
+    """
+    try:
+        retry_after = float(response.headers['Retry-After'])
+    except (KeyError, ValueError):
+        backoff = 2 ** attempt
+        return min(backoff + random.uniform(0, backoff * 0.25), MAX_RETRY_WAIT)
+
+    if retry_after > MAX_RETRY_WAIT:
+        return None
+    return retry_after + random.uniform(0, retry_after * 0.25)
+
+
+async def query_database(client: httpx.AsyncClient, bucket: TokenBucket, breaker: CircuitBreaker,
+                         database_id: str, filters: dict) -> AsyncIterator[str]:
     """Query Notion database for records matching deletion criteria.
 
+    Page IDs are yielded as each page of results arrives, so callers can
+    start deleting before pagination has finished. Rate-limited requests
+    are retried; any other failure is logged and re-raised, so a partial
+    result is never mistaken for a complete one.
+
     Args:
-        api_key: Notion API key
+        client: Shared HTTP client configured for the Notion API
+        bucket: Shared rate limiter
+        breaker: Shared circuit breaker
         database_id: ID of the Notion database to query
         filters: Filter criteria in Notion's filter format
 
-    Returns:
-        list: List of page IDs that match the criteria
+    Yields:
+        str: IDs of pages that match the criteria
+
+    Raises:
+        httpx.HTTPError: If a query page cannot be fetched
     """
-    page_ids = []
+    max_retries = 3
+    found = 0
     has_more = True
     start_cursor = None
 
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json',
-        'Notion-Version': '2022-06-28'
-    }
+    logger.info(f"Querying database {database_id} with filters: {orjson.dumps(filters, option=orjson.OPT_INDENT_2).decode()}")
 
-    logger.info(f"Querying database {database_id} with filters: {json.dumps(filters, indent=2)}")
+    # Every page shares the same filter, so encode it once and splice only
+    # the cursor into each request body
+    body_prefix = b'{"filter":' + orjson.dumps(filters) + b',"page_size":' + str(QUERY_PAGE_SIZE).encode()
 
     try:
         while has_more:
             # Build request body
-            body = {"filter": filters}
+            body = body_prefix
             if start_cursor:
-                body["start_cursor"] = start_cursor
-
-            # Query database using HTTP request
-            response = httpx.post(
-                f'https://api.notion.com/v1/databases/{database_id}/query',
-                headers=headers,
-                json=body,
-                timeout=30.0
-            )
+                body += b',"start_cursor":' + orjson.dumps(start_cursor)
+            body += b'}'
+
+            # Query database using HTTP request, retrying rate limits
+            for attempt in range(max_retries):
+                await breaker.acquire()
+                response = await client.post(
+                    f'/v1/databases/{database_id}/query',
+                    content=body
+                )
+                if response.status_code == 429 or response.status_code >= 500:
+                    breaker.record_failure()
+                elif response.is_success:
+                    breaker.record_success()
+                if response.status_code != 429 or attempt == max_retries - 1:
+                    break
+                wait_time = _retry_wait(response, attempt)
+                if wait_time is None:
+                    logger.error(f"Retry-After of {response.headers['Retry-After']}s for database "
+                                 f"{database_id} exceeds {MAX_RETRY_WAIT:.0f}s, not retrying")
+                    break
+                bucket.on_rate_limited(wait_time)
+                logger.warning(f"Rate limited querying database {database_id}, waiting {wait_time:.2f}s "
+                               f"(attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
             response.raise_for_status()
-            data = response.json()
-
-            # Extract page IDs from results
-            for page in data.get('results', []):
-                page_ids.append(page['id'])
+            data = orjson.loads(response.content)
 
             # Check if there are more results
             has_more = data.get('has_more', False)
             start_cursor = data.get('next_cursor')
 
-            # Rate limiting between pages
-            if has_more:
-                time.sleep(0.35)
+            # Hand page IDs to the caller before fetching the next page,
+            # skipping pages already in the trash so they cost no PATCH
+            for page in data.get('results', []):
+                if page.get('archived') or page.get('in_trash'):
+                    continue
+                found += 1
+                yield page['id']
 
-        logger.info(f"Found {len(page_ids)} records matching criteria")
-        return page_ids
+        logger.info(f"Found {found} records matching criteria")
 
     except httpx.HTTPStatusError as e:
         logger.error(f"Error querying database: {e.response.text}")
-        return []
+        raise
     except Exception as e:
         logger.error(f"Error querying database: {e}")
-        return []
+        raise
 
 
-def delete_page(api_key: str, page_id: str, dry_run: bool = False) -> bool:
+async def delete_page(client: httpx.AsyncClient, bucket: TokenBucket, breaker: CircuitBreaker,
+                      page_id: str, dry_run: bool = False) -> bool:
     """Delete (archive) a single Notion page with retry logic.
 
     Args:
-        api_key: Notion API key
+        client: Shared HTTP client configured for the Notion API
+        bucket: Shared rate limiter
+        breaker: Shared circuit breaker
         page_id: ID of the page to delete
         dry_run: If True, only log what would be deleted (don't actually delete)
 
@@ -241,41 +494,41 @@ def delete_page(api_key: str, page_id: str, dry_run: bool = False) -> bool:
         bool: True if successful, False otherwise
     """
     if dry_run:
-        logger.info(f"[DRY RUN] Would delete page: {page_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[DRY RUN] Would delete page: {page_id}")
         return True
 
     max_retries = 3
-    retry_delay = 1  # Initial delay in seconds
-
-    headers = {
-        'Authorization': f'Bearer {api_key}',
-        'Content-Type': 'application/json',
-        'Notion-Version': '2022-06-28'
-    }
 
     for attempt in range(max_retries):
         try:
             # Archive the page (moves to trash, recoverable for 30 days)
-            response = httpx.patch(
-                f'https://api.notion.com/v1/pages/{page_id}',
-                headers=headers,
-                json={"archived": True},
+            await breaker.acquire()
+            response = await client.patch(
+                f'/v1/pages/{page_id}',
+                content=ARCHIVE_BODY,
                 timeout=10.0
             )
             response.raise_for_status()
-            logger.info(f"✓ Deleted page: {page_id}")
-
-            # Rate limiting: 0.35 seconds = ~3 requests/second (Notion's limit)
-            time.sleep(0.35)
+            breaker.record_success()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"✓ Deleted page: {page_id}")
             return True
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 429:
-                # Exponential backoff for rate limits
-                wait_time = retry_delay * (2 ** attempt)
-                logger.warning(f"Rate limited on page {page_id}, waiting {wait_time}s (attempt {attempt + 1}/{max_retries})")
-                time.sleep(wait_time)
+                breaker.record_failure()
+                wait_time = _retry_wait(e.response, attempt)
+                if wait_time is None:
+                    logger.error(f"Retry-After of {e.response.headers['Retry-After']}s for page {page_id} "
+                                 f"exceeds {MAX_RETRY_WAIT:.0f}s, not retrying")
+                    return False
+                bucket.on_rate_limited(wait_time)
+                logger.warning(f"Rate limited on page {page_id}, waiting {wait_time:.2f}s (attempt {attempt + 1}/{max_retries})")
+                await asyncio.sleep(wait_time)
             else:
+                if e.response.status_code >= 500:
+                    breaker.record_failure()
                 logger.error(f"Error deleting page {page_id}: {e.response.text}")
                 return False
         except Exception as e:
@@ -286,6 +539,162 @@ def delete_page(api_key: str, page_id: str, dry_run: bool = False) -> bool:
     return False
 
 
+async def delete_pages(client: httpx.AsyncClient, bucket: TokenBucket, breaker: CircuitBreaker,
+                       page_ids: list[str], dry_run: bool = False,
+                       slots: asyncio.Semaphore | None = None) -> list[bool]:
+    """Delete (archive) a batch of Notion pages.
+
+    Notion has no bulk archive endpoint, so the batch is sent as concurrent
+    PATCH requests multiplexed over the shared HTTP/2 connection and paced
+    by the rate limiter. Archiving is idempotent, so a retried request
+    cannot archive a page twice.
+
+    Args:
+        client: Shared HTTP client configured for the Notion API
+        bucket: Shared rate limiter
+        breaker: Shared circuit breaker
+        page_ids: IDs of the pages to delete
+        dry_run: If True, only log what would be deleted (don't actually delete)
+        slots: Semaphore the caller acquired once per page; each slot is
+            released as soon as its page finishes, not when the whole batch does
+
+    Returns:
+        list: One success flag per page, in the same order as page_ids
+    """
+    async def delete_one(page_id: str) -> bool:
+        try:
+            return await delete_page(client, bucket, breaker, page_id, dry_run=dry_run)
+        finally:
+            if slots is not None:
+                slots.release()
+
+    return await asyncio.gather(*[delete_one(page_id) for page_id in page_ids])
+
+
+async def process_database(client: httpx.AsyncClient, bucket: TokenBucket, breaker: CircuitBreaker,
+                           db_config: dict, dry_run: bool) -> CleanupStats:
+    """Query and delete matching records for a single configured database.
+
+    A producer streams matching page IDs from the query into a bounded
+    queue in batches of DELETE_BATCH_SIZE. A consumer dispatches each batch
+    as soon as enough delete slots are free (at most DELETE_MAX_IN_FLIGHT
+    pages in flight), so deletes start with the first page of results and
+    a slow page holds up only its own slot, not its batch.
+
+    Args:
+        client: Shared HTTP client configured for the Notion API
+        bucket: Shared rate limiter
+        breaker: Shared circuit breaker
+        db_config: One entry from the configuration's 'databases' list
+        dry_run: Default dry-run setting, overridden by db_config['dry_run']
+
+    Returns:
+        CleanupStats: Counts for this database
+    """
+    stats = CleanupStats(queried=1)
+
+    database_id = format_notion_id(db_config['database_id'])
+    database_name = db_config.get('name', database_id)
+    filters = db_config['filters']
+
+    # Override dry_run if specified in config
+    db_dry_run = db_config.get('dry_run', dry_run)
+
+    logger.info(f"\n{'=' * 60}")
+    logger.info(f"Processing database: {database_name}")
+    logger.info(f"Database ID: {database_id}")
+    logger.info(f"{'=' * 60}")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=DELETE_QUEUE_SIZE // DELETE_BATCH_SIZE)
+    slots = asyncio.Semaphore(DELETE_MAX_IN_FLIGHT)
+
+    async def produce() -> None:
+        # Query for records matching deletion criteria
+        batch = []
+        try:
+            async for page_id in query_database(client, bucket, breaker, database_id, filters):
+                stats.matched += 1
+                batch.append(page_id)
+                if len(batch) == DELETE_BATCH_SIZE:
+                    await queue.put(batch)
+                    batch = []
+            if batch:
+                await queue.put(batch)
+        except Exception:
+            # Already logged by query_database; deletes of the pages found so
+            # far still run, but the run must not be reported as complete
+            stats.query_failed += 1
+        finally:
+            # Sentinel so the consumer exits
+            await queue.put(None)
+
+    async def delete_batch(batch: list[str]) -> None:
+        results = await delete_pages(client, bucket, breaker, batch, dry_run=db_dry_run, slots=slots)
+        stats.deleted += sum(results)
+        stats.failed += len(results) - sum(results)
+
+        processed = stats.deleted + stats.failed
+        if processed // PROGRESS_INTERVAL > (processed - len(batch)) // PROGRESS_INTERVAL:
+            logger.info(f"{processed} records processed from {database_name}")
+
+    async def consume() -> None:
+        batches = set()
+        while (batch := await queue.get()) is not None:
+            # Hold one slot per page before dispatching; delete_pages frees
+            # each slot as its page finishes
+            for _ in batch:
+                await slots.acquire()
+            task = asyncio.create_task(delete_batch(batch))
+            batches.add(task)
+            task.add_done_callback(batches.discard)
+        await asyncio.gather(*batches)
+
+    await asyncio.gather(produce(), consume())
+
+    if not stats.matched:
+        logger.info(f"No records found matching deletion criteria in {database_name}")
+
+    return stats
+
+
+async def run_cleanup(api_key: str, config: dict, dry_run: bool) -> CleanupStats:
+    """Query and delete matching records for every configured database.
+
+    Databases are processed concurrently; they share one HTTP/2 client and
+    one rate limiter, so the global request rate is unchanged.
+
+    Args:
+        api_key: Notion API key
+        config: Parsed deletion rules
+        dry_run: Default dry-run setting, overridable per database
+
+    Returns:
+        CleanupStats: Counts summed across all databases
+    """
+    # One HTTP/2 connection for the whole run: keep-alive avoids a fresh
+    # TCP+TLS handshake per request, and concurrent deletes are multiplexed
+    # as streams on it
+    client = httpx.AsyncClient(
+        base_url='https://api.notion.com',
+        headers=_build_headers(api_key),
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=1, max_connections=1)
+    )
+
+    # Shared by queries and deletes so the run as a whole stays within ~3 req/s
+    bucket = TokenBucket(rate=3.0, capacity=3)
+    breaker = CircuitBreaker(bucket)
+
+    async with client:
+        results = await asyncio.gather(*[
+            process_database(client, bucket, breaker, db_config, dry_run)
+            for db_config in config['databases']
+        ])
+
+    return sum(results, CleanupStats())
+
+
 def main():
     """Main execution flow."""
     parser = argparse.ArgumentParser(
@@ -302,8 +711,17 @@ def main():
         help='Dry run mode: show what would be deleted without actually deleting'
     )
 
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='Log every page that is (or, in dry run mode, would be) deleted'
+    )
+
     args = parser.parse_args()
 
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
     # Check for DRY_RUN environment variable (set by GitHub Actions)
     env_dry_run = os.environ.get('DRY_RUN', '').lower() in ('true', '1', 'yes')
     dry_run = args.dry_run or env_dry_run
@@ -319,62 +737,25 @@ def main():
     # Load deletion rules from config file
     config = load_deletion_rules(args.config)
 
-    # Statistics tracking
-    total_queried = 0
-    total_matched = 0
-    total_deleted = 0
-    total_failed = 0
-
-    # Process each database in the configuration
-    for db_config in config['databases']:
-        database_id = format_notion_id(db_config['database_id'])
-        database_name = db_config.get('name', database_id)
-        filters = db_config['filters']
-
-        # Override dry_run if specified in config
-        db_dry_run = db_config.get('dry_run', dry_run)
-
-        logger.info(f"\n{'=' * 60}")
-        logger.info(f"Processing database: {database_name}")
-        logger.info(f"Database ID: {database_id}")
-        logger.info(f"{'=' * 60}")
-
-        # Query for records matching deletion criteria
-        page_ids = query_database(api_key, database_id, filters)
-        total_queried += 1
-        total_matched += len(page_ids)
-
-        if not page_ids:
-            logger.info("No records found matching deletion criteria")
-            continue
-
-        # Delete each matching record
-        logger.info(f"\nDeleting {len(page_ids)} records...")
-        for i, page_id in enumerate(page_ids, 1):
-            logger.info(f"Processing record {i}/{len(page_ids)}")
-
-            success = delete_page(api_key, page_id, dry_run=db_dry_run)
-            if success:
-                total_deleted += 1
-            else:
-                total_failed += 1
+    stats = asyncio.run(run_cleanup(api_key, config, dry_run))
 
     # Print summary
     logger.info(f"\n{'=' * 60}")
     logger.info("CLEANUP SUMMARY")
     logger.info(f"{'=' * 60}")
-    logger.info(f"Databases processed: {total_queried}")
-    logger.info(f"Records matched: {total_matched}")
-    logger.info(f"Records deleted: {total_deleted}")
-    logger.info(f"Records failed: {total_failed}")
+    logger.info(f"Databases processed: {stats.queried}")
+    logger.info(f"Records matched: {stats.matched}")
+    logger.info(f"Records deleted: {stats.deleted}")
+    logger.info(f"Records failed: {stats.failed}")
+    logger.info(f"Database queries failed: {stats.query_failed}")
 
     if dry_run:
         logger.info(f"\nDRY RUN MODE: No actual deletions occurred")
     else:
         logger.info(f"\nDeleted records are in Notion trash (recoverable for 30 days)")
 
-    # Exit with error code if any deletions failed
-    if total_failed > 0:
+    # Exit with error code if any deletions or queries failed
+    if stats.failed > 0 or stats.query_failed > 0:
         sys.exit(1)
 
     # Exit successfully if no failures occurred
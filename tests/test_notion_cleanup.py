@@ -0,0 +1,195 @@
+"""Tests for scripts/notion_cleanup.py.
+
+Run with: python -m unittest discover tests
+"""
+
+import asyncio
+import json
+import os
+import sys
+import time
+import unittest
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import notion_cleanup  # noqa: E402
+
+DATABASE_ID = 'a' * 32
+
+
+def make_pages(count):
+    return [f'{i:032x}' for i in range(count)]
+
+
+def run_process_database(handler, dry_run=False):
+    """Run process_database against a mock Notion API and return its stats."""
+    bucket = notion_cleanup.TokenBucket(rate=1000.0, capacity=100)
+    breaker = notion_cleanup.CircuitBreaker(bucket)
+    db_config = {'database_id': DATABASE_ID, 'name': 'Test', 'filters': {}}
+
+    async def run():
+        async with httpx.AsyncClient(base_url='https://api.notion.com',
+                                     transport=httpx.MockTransport(handler)) as client:
+            return await notion_cleanup.process_database(client, bucket, breaker, db_config, dry_run)
+
+    return asyncio.run(run())
+
+
+class FormatNotionIdTest(unittest.TestCase):
+
+    UUID = 'abcdef01-2345-6789-abcd-ef0123456789'
+
+    def test_dashed_id(self):
+        self.assertEqual(notion_cleanup.format_notion_id(self.UUID), self.UUID)
+
+    def test_undashed_id(self):
+        self.assertEqual(notion_cleanup.format_notion_id(self.UUID.replace('-', '')), self.UUID)
+
+    def test_id_with_spaces(self):
+        self.assertEqual(notion_cleanup.format_notion_id(' abcdef01 23456789abcdef0123456789 '), self.UUID)
+
+    def test_invalid_id_returned_unchanged(self):
+        for notion_id in ('not-a-notion-id', 'abcdef0123456789', 'g' * 32):
+            with self.subTest(notion_id=notion_id):
+                with self.assertLogs(notion_cleanup.logger, level='WARNING'):
+                    self.assertEqual(notion_cleanup.format_notion_id(notion_id), notion_id)
+
+
+class RetryWaitTest(unittest.TestCase):
+
+    def test_retry_after_is_a_minimum(self):
+        response = httpx.Response(429, headers={'Retry-After': '2'})
+        self.assertTrue(2.0 <= notion_cleanup._retry_wait(response, 0) <= 2.5)
+
+    def test_retry_after_beyond_ceiling_is_not_retried(self):
+        response = httpx.Response(429, headers={'Retry-After': '60'})
+        self.assertIsNone(notion_cleanup._retry_wait(response, 0))
+
+    def test_backoff_without_retry_after_is_capped(self):
+        response = httpx.Response(429)
+        self.assertLessEqual(notion_cleanup._retry_wait(response, 10), notion_cleanup.MAX_RETRY_WAIT)
+
+
+class QueryDatabaseTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pages = make_pages(230)
+        self.query_calls = 0
+        self.deleted = []
+
+    def query_response(self, request):
+        body = json.loads(request.content)
+        start = int(body.get('start_cursor') or 0)
+        end = start + body['page_size']
+        return httpx.Response(200, json={
+            'results': [{'id': page_id} for page_id in self.pages[start:end]],
+            'has_more': end < len(self.pages),
+            'next_cursor': str(end) if end < len(self.pages) else None
+        })
+
+    def test_query_failure_mid_pagination_is_reported(self):
+        def handler(request):
+            if request.method == 'PATCH':
+                self.deleted.append(request.url.path.rsplit('/', 1)[-1])
+                return httpx.Response(200, json={})
+            self.query_calls += 1
+            if self.query_calls == 2:
+                return httpx.Response(500, json={'message': 'internal error'})
+            return self.query_response(request)
+
+        stats = run_process_database(handler)
+
+        self.assertEqual(stats.query_failed, 1)
+        self.assertEqual(stats.matched, 100)
+        self.assertEqual(sorted(self.deleted), self.pages[:100])
+        self.assertEqual(stats.deleted, 100)
+
+    def test_rate_limited_query_is_retried(self):
+        def handler(request):
+            if request.method == 'PATCH':
+                self.deleted.append(request.url.path.rsplit('/', 1)[-1])
+                return httpx.Response(200, json={})
+            self.query_calls += 1
+            if self.query_calls == 1:
+                return httpx.Response(429, headers={'Retry-After': '0'}, json={})
+            return self.query_response(request)
+
+        stats = run_process_database(handler)
+
+        self.assertEqual(stats.query_failed, 0)
+        self.assertEqual(stats.matched, 230)
+        self.assertEqual(stats.deleted, 230)
+        self.assertEqual(stats.failed, 0)
+        self.assertEqual(sorted(self.deleted), self.pages)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def test_tripping_on_429s_halves_rate(self):
+        """Opening the circuit slows the limiter even inside a 429 hold window."""
+        bucket = notion_cleanup.TokenBucket(rate=20.0, capacity=1)
+        breaker = notion_cleanup.CircuitBreaker(bucket, window=10, threshold=4, cooldown=30.0)
+
+        # Same sequence delete_page runs on each 429
+        for _ in range(breaker.threshold + 1):
+            bucket.on_rate_limited(1.0)
+            breaker.record_failure()
+
+        self.assertGreater(breaker.open_until, time.monotonic())
+        self.assertEqual(bucket.rate, 5.0)
+        self.assertGreaterEqual(bucket.hold_until, breaker.open_until)
+
+    def test_query_429s_open_circuit(self):
+        """Rate-limited queries count towards the breaker like deletes do."""
+        bucket = notion_cleanup.TokenBucket(rate=1000.0, capacity=10)
+        breaker = notion_cleanup.CircuitBreaker(bucket, window=10, threshold=2, cooldown=0.1)
+
+        def handler(request):
+            return httpx.Response(429, headers={'Retry-After': '0'}, json={})
+
+        async def run():
+            async with httpx.AsyncClient(base_url='https://api.notion.com',
+                                         transport=httpx.MockTransport(handler)) as client:
+                return [page_id async for page_id in notion_cleanup.query_database(
+                    client, bucket, breaker, DATABASE_ID, {}
+                )]
+
+        start = time.monotonic()
+        with self.assertRaises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        self.assertGreater(breaker.open_until, start)
+
+    def test_no_requests_sent_while_circuit_open(self):
+        """Deletes queued for a token must not go out during the cooldown."""
+        bucket = notion_cleanup.TokenBucket(rate=50.0, capacity=1, min_rate=25.0)
+        breaker = notion_cleanup.CircuitBreaker(bucket, window=10, threshold=4, cooldown=0.3)
+        sent = []
+        sent_while_open = []
+
+        def handler(request):
+            now = time.monotonic()
+            sent.append(now)
+            if now < breaker.open_until:
+                sent_while_open.append(now)
+            return httpx.Response(503, json={'message': 'unavailable'})
+
+        async def run():
+            async with httpx.AsyncClient(base_url='https://api.notion.com',
+                                         transport=httpx.MockTransport(handler)) as client:
+                return await notion_cleanup.delete_pages(
+                    client, bucket, breaker, [f'{i:032x}' for i in range(30)]
+                )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, [False] * 30)
+        self.assertEqual(len(sent), 30)
+        self.assertEqual(sent_while_open, [])
+        # The circuit opened at least once, pausing the run for a cooldown
+        self.assertGreaterEqual(max(sent) - min(sent), breaker.cooldown)
+
+
+if __name__ == '__main__':
+    unittest.main()